@@ -2,16 +2,13 @@ import asyncio
 import random
 import disnake
 from disnake.ext import commands
-from elevenlabs import generate, save
-from elevenlabs import set_api_key
-import utils.env as env
+from elevenlabs import save
+from utils.backends import generate_audio
 from dota.dota2View import Dota2View
 from dota import team_announce
 from disnake.ext import tasks
 from datetime import datetime, timedelta
 
-set_api_key(env.ELEVENLABS_API)
-
 
 def async_to_sync(async_func):
     def wrapper(*args, **kwargs):
@@ -72,7 +69,7 @@ class Poll(commands.Cog):
         await ctx.send(f"Eis os escolhidos das <t:{timestamp}:t>! <t:{timestamp}:R>! \n {ids_str}")
         await ctx.send(file=disnake.File("group_photo.gif"))
         frase = self._bot.content.get_random("abertura_frases")
-        audio = generate(
+        audio = generate_audio(
             text=frase.replace("*", ""),
             voice=random.choice(["RpvoK8WoHsA3IVJ5sZRq", "Josh", "Bella", "Adam"]),
             model="eleven_multilingual_v1"
@@ -7,6 +7,8 @@ import pytz
 
 class DataHandler:
     timezone = pytz.timezone('America/Sao_Paulo')
+    # replaced by soak.py to fast-forward days, None means the real clock
+    clock = None
 
     def __init__(self, json_file='Data.json'):
         self.json_file = json_file
@@ -86,11 +88,17 @@ class DataHandler:
 
         return most_voted_time, unix_timestamp
 
+    @staticmethod
+    def now():
+        if DataHandler.clock is not None:
+            return DataHandler.clock()
+        return datetime.now(DataHandler.timezone)
+
     @staticmethod
     def time_to_unix_timestamp(time):
         if time:
             hour, minute = map(int, time.split('h'))
-            now = datetime.now(DataHandler.timezone)
+            now = DataHandler.now()
             selected_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
             if selected_time < now:
                 selected_time += timedelta(days=1)
@@ -100,7 +108,7 @@ class DataHandler:
         return unix_timestamp
 
     def __generate_data(self):
-        date_now = datetime.now(DataHandler.timezone).date()
+        date_now = DataHandler.now().date()
 
         data = {
             "timestamp": date_now.isoformat(),
@@ -123,7 +131,7 @@ class DataHandler:
 
         # verify if date is from the same day
         # otherwise regerate data
-        date_now = datetime.now(DataHandler.timezone).date()
+        date_now = DataHandler.now().date()
 
         if "timestamp" in self.dict:
             # ensure we're at the same day
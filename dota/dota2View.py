@@ -1,10 +1,9 @@
+import asyncio
 import os
-from datetime import datetime, timedelta
+from datetime import timedelta
 import disnake
-import pytz
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.schedulers.base import STATE_STOPPED
-from elevenlabs import save
 from dota import team_announce
 from dota.dataHandler import DataHandler
 
@@ -122,10 +121,10 @@ class Dota2View(disnake.ui.View):
             split_time = time_str.split("h")
             hour = int(split_time[0])
             minute = int(split_time[1]) if len(split_time) > 1 and split_time[1] else 0
-            run_date = datetime.now(pytz.timezone('America/Sao_Paulo'))
+            run_date = DataHandler.now()
             run_date = run_date.replace(hour=hour - 1, minute=minute, second=0, microsecond=0)
 
-            if run_date < datetime.now(pytz.timezone('America/Sao_Paulo')):
+            if run_date < DataHandler.now():
                 run_date += timedelta(days=1)
 
             self.scheduler.add_job(self.sync_send_reminder, 'date', run_date=run_date, args=[time_formatted], id=job_id)
@@ -134,7 +133,8 @@ class Dota2View(disnake.ui.View):
         await interaction.response.edit_message(view=self, embed=self.create_embed())
 
     def sync_send_reminder(self, selected_time):
-        self.loop.create_task(self.send_reminder(selected_time))
+        # runs on the scheduler thread, so hand the coroutine to the bot loop safely
+        asyncio.run_coroutine_threadsafe(self.send_reminder(selected_time), self.loop)
 
     async def send_reminder(self, selected_time):
         member_ids = self.data.get_users_list_at_time(selected_time)
@@ -154,13 +154,11 @@ class Dota2View(disnake.ui.View):
         await self.ctx.send(f"Eis os escolhidos das <t:{unix_timestamp}:t>! <t:{unix_timestamp}:R>! \n {ids_str}")
         await self.ctx.send(file=disnake.File("group_photo.gif"))
 
-        frase = self.bot.content.get_random("frases")
-        imagem = self.bot.content.get_random("imagens")
+        frase = self.bot.content.get_random("abertura_frases")
+        imagem = self.bot.content.get_random("abertura_imagens")
         await self.ctx.send(frase)
         await self.ctx.send(imagem)
 
-        save("content", self.bot.content)
-
     async def remove(self):
         await self.message.delete()
 
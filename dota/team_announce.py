@@ -1,7 +1,7 @@
 import random
 import io
-import aiohttp
 from PIL import Image, ImageSequence
+from utils.backends import fetch_bytes
 
 
 async def get_avatar_image(guild, user_id, size):
@@ -10,9 +10,7 @@ async def get_avatar_image(guild, user_id, size):
         return None, None
 
     avatar_url = member.avatar.url
-    async with aiohttp.ClientSession() as session:
-        async with session.get(avatar_url) as response:
-            image_data = await response.read()
+    image_data = await fetch_bytes(avatar_url)
 
     image = Image.open(io.BytesIO(image_data))
 
@@ -52,9 +50,7 @@ async def create_team_photo(ctx, photo_setups, member_ids):
 async def process_photo(ctx, photo_setup, member_ids):
     photo_url = photo_setup[0]
     photo_url = photo_url.strip()
-    async with aiohttp.ClientSession() as session:
-        async with session.get(photo_url) as response:
-            image_data = await response.read()
+    image_data = await fetch_bytes(photo_url)
 
     avatarPhotoPositionList = photo_setup[1]
     group_photo = Image.new("RGBA", (950, 512), (0, 0, 0, 0))
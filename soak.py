@@ -0,0 +1,316 @@
+"""
+Replays poll days against the local backends and reports process growth.
+
+Each simulated day runs the same flow the bot sees in a guild: /readycheck,
+a burst of button toggles, a few /anunciar calls and the scheduled reminders.
+DataHandler.clock is moved forward one day per iteration, so the poll data
+rolls over the way it does at midnight. The scheduler still runs on the real
+clock, so reminders are forced to fire immediately, and the view is stopped
+by hand instead of waiting out its timeout.
+Nothing talks to Discord, Google Sheets, ElevenLabs or the CDN.
+
+    python soak.py --days 90 --toggles 400 --csv soak.csv
+"""
+import argparse
+import asyncio
+import csv
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+os.environ["BACKEND"] = "local"
+os.environ.setdefault("BOT_TOKEN", "local")
+os.environ.setdefault("GUILD_ID", "1")
+os.environ.setdefault("ROLE_ID", "2")
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cogs.poll import Poll
+from dota.dataHandler import DataHandler
+from utils.content import Content
+
+REMINDER_TIMEOUT = 30
+READYCHECK_TIMEOUT = 30
+
+
+class FakeAsset:
+    def __init__(self, url):
+        self.url = url
+
+
+class FakeUser:
+    def __init__(self, user_id):
+        self.id = user_id
+        self.mention = f"<@{user_id}>"
+        extension = "gif" if user_id % 3 == 0 else "png"
+        self.avatar = FakeAsset(f"http://local.test/avatars/{user_id}.{extension}")
+
+
+class FakeRole:
+    def __init__(self, role_id):
+        self.id = role_id
+        self.mention = f"<@&{role_id}>"
+
+
+class FakeGuild:
+    def __init__(self, members, role):
+        self._members = {member.id: member for member in members}
+        self._role = role
+
+    def get_member(self, user_id):
+        return self._members.get(user_id)
+
+    def get_role(self, role_id):
+        return self._role if role_id == self._role.id else None
+
+
+class FakeChannel:
+    def __init__(self, channel_id):
+        self.id = channel_id
+        self.sent = 0
+
+    async def send(self, content=None, *, file=None, **kwargs):
+        if not content and file is None and not kwargs.get("embed") and not kwargs.get("view"):
+            # Discord answers this with 400 Cannot send an empty message
+            raise ValueError("Cannot send an empty message")
+        self.sent += 1
+        if file is not None:
+            file.close()
+        return FakeMessage()
+
+
+class FakeMessage:
+    async def edit(self, **kwargs):
+        pass
+
+    async def delete(self):
+        pass
+
+
+class FakeResponse:
+    async def edit_message(self, **kwargs):
+        pass
+
+
+class FakeInteraction:
+    def __init__(self, user, guild, channel):
+        self.author = user
+        self.user = user
+        self.guild = guild
+        self.channel = channel
+        self.response = FakeResponse()
+
+    async def send(self, *args, **kwargs):
+        return await self.channel.send(*args, **kwargs)
+
+
+class FakeBot:
+    def __init__(self, loop, content):
+        self.loop = loop
+        self.content = content
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # peak instead of current, but better than nothing off Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def open_files():
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
+
+
+def p95(samples):
+    if not samples:
+        return 0.0
+    if len(samples) < 2:
+        return samples[0]
+    return statistics.quantiles(samples, n=20)[-1]
+
+
+class Soak:
+    def __init__(self, args):
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.members = [FakeUser(1000 + index) for index in range(args.members)]
+        self.guild = FakeGuild(self.members, FakeRole(int(os.environ["ROLE_ID"])))
+        self.channel = FakeChannel(1)
+        self.rows = []
+        self.sim_now = DataHandler.now()
+
+    def interaction(self, user=None):
+        return FakeInteraction(user or self.members[0], self.guild, self.channel)
+
+    async def run(self):
+        DataHandler.clock = lambda: self.sim_now
+        bot = FakeBot(asyncio.get_running_loop(), Content())
+        poll = Poll(bot)
+        started = time.perf_counter()
+
+        for day in range(1, self.args.days + 1):
+            row = await self.run_day(poll, day)
+            row["wall_s"] = round(time.perf_counter() - started, 1)
+            self.rows.append(row)
+            self.report(row)
+            self.sim_now += timedelta(days=1)
+
+        return self.rows
+
+    async def run_day(self, poll, day):
+        errors = 0
+
+        previous_view = poll.view
+        readycheck = asyncio.create_task(poll.readycheck.callback(poll, self.interaction()))
+        deadline = time.perf_counter() + READYCHECK_TIMEOUT
+        while poll.view is previous_view or poll.view.message is None:
+            if readycheck.done():
+                # raises whatever broke /readycheck before the poll was posted
+                readycheck.result()
+                raise RuntimeError(f"Day {day}: /readycheck finished without posting the poll")
+            if time.perf_counter() > deadline:
+                readycheck.cancel()
+                raise RuntimeError(f"Day {day}: /readycheck did not post the poll in {READYCHECK_TIMEOUT}s")
+            await asyncio.sleep(0.01)
+        view = poll.view
+
+        if view.data.dict["timestamp"] != self.sim_now.date().isoformat() or any(view.data.dict["times"].values()):
+            print(f"[Soak] Day {day}: poll data did not roll over")
+            errors += 1
+
+        reminders = {"done": 0, "errors": 0, "latencies": []}
+        send_reminder = view.send_reminder
+        forced_at = time.perf_counter()
+
+        async def tracked_send_reminder(selected_time):
+            try:
+                await send_reminder(selected_time)
+            except Exception as e:
+                print(f"[Soak] Reminder {selected_time} failed: {e!r}")
+                reminders["errors"] += 1
+            reminders["latencies"].append(time.perf_counter() - forced_at)
+            reminders["done"] += 1
+
+        view.send_reminder = tracked_send_reminder
+
+        toggle_latencies = []
+        buttons = list(view.buttons.values())
+        for _ in range(self.args.toggles):
+            button = self.random.choice(buttons)
+            interaction = self.interaction(self.random.choice(self.members))
+            begin = time.perf_counter()
+            try:
+                await button.callback(interaction)
+            except Exception as e:
+                print(f"[Soak] Toggle {button.time} failed: {e!r}")
+                errors += 1
+            toggle_latencies.append(time.perf_counter() - begin)
+
+        announce_latencies = []
+        for _ in range(self.args.announcements):
+            begin = time.perf_counter()
+            try:
+                await poll.anunciar.callback(poll, self.interaction())
+            except Exception as e:
+                print(f"[Soak] Announcement failed: {e!r}")
+                errors += 1
+            announce_latencies.append(time.perf_counter() - begin)
+
+        # the scheduler only knows the real clock, so move every reminder to now
+        jobs = view.scheduler.get_jobs()
+        forced_at = time.perf_counter()
+        now = datetime.now(DataHandler.timezone)
+        for job in jobs:
+            job.modify(next_run_time=now)
+        view.scheduler.wakeup()
+
+        deadline = time.perf_counter() + REMINDER_TIMEOUT
+        while reminders["done"] < len(jobs) and time.perf_counter() < deadline:
+            await asyncio.sleep(0.01)
+        if reminders["done"] < len(jobs):
+            print(f"[Soak] Day {day}: {len(jobs) - reminders['done']} reminders never fired")
+            errors += len(jobs) - reminders["done"]
+
+        # the view would normally time out at the end of the day
+        view.stop()
+        await readycheck
+
+        return {
+            "day": day,
+            "sim_hours": day * 24,
+            "rss_mb": round(rss_mb(), 1),
+            "threads": threading.active_count(),
+            "open_files": open_files(),
+            "toggle_p95_ms": round(p95(toggle_latencies) * 1000, 2),
+            "announce_p95_ms": round(p95(announce_latencies) * 1000, 2),
+            "reminders": reminders["done"],
+            "reminder_p95_ms": round(p95(reminders["latencies"]) * 1000, 2),
+            "errors": errors + reminders["errors"],
+        }
+
+    def report(self, row):
+        baseline = self.rows[0]
+        drift = row["toggle_p95_ms"] / baseline["toggle_p95_ms"] if baseline["toggle_p95_ms"] else 0.0
+        row["toggle_drift"] = round(drift, 2)
+        print(f"[Soak] day {row['day']:>4} ({row['sim_hours']}h sim, {row['wall_s']}s wall) "
+              f"rss={row['rss_mb']}MB threads={row['threads']} files={row['open_files']} "
+              f"toggle_p95={row['toggle_p95_ms']}ms (x{row['toggle_drift']}) "
+              f"announce_p95={row['announce_p95_ms']}ms "
+              f"reminders={row['reminders']} reminder_p95={row['reminder_p95_ms']}ms "
+              f"errors={row['errors']}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Soak test the poll flow against local backends.")
+    parser.add_argument("--days", type=int, default=30, help="simulated poll days to replay")
+    parser.add_argument("--toggles", type=int, default=300, help="button toggles per day")
+    parser.add_argument("--members", type=int, default=12, help="guild members voting")
+    parser.add_argument("--announcements", type=int, default=3, help="/anunciar calls per day")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the replayed votes")
+    parser.add_argument("--workdir", help="where Data.json and generated media go (default: temp dir)")
+    parser.add_argument("--csv", help="also write one row per day to this file")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    csv_path = os.path.abspath(args.csv) if args.csv else None
+    random.seed(args.seed)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="xinela-soak-")
+    os.makedirs(workdir, exist_ok=True)
+    os.chdir(workdir)
+    print(f"[Soak] Working in {workdir}")
+
+    rows = asyncio.run(Soak(args).run())
+
+    if csv_path:
+        with open(csv_path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+
+    first, last = rows[0], rows[-1]
+    print(f"[Soak] {len(rows)} days: rss {first['rss_mb']} -> {last['rss_mb']}MB, "
+          f"threads {first['threads']} -> {last['threads']}, "
+          f"open files {first['open_files']} -> {last['open_files']}, "
+          f"toggle p95 drift x{last['toggle_drift']}")
+
+
+if __name__ == "__main__":
+    main()
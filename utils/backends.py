@@ -0,0 +1,112 @@
+import ast
+import io
+import json
+import wave
+import zlib
+import aiohttp
+from PIL import Image
+import utils.env as env
+
+LIVE = "live"
+LOCAL = "local"
+
+# Default content served by the local sheet, keyed by the same column indexes
+# Content reads from the real spreadsheet.
+LOCAL_COLUMNS = {
+    1: ["18h00", "19h00", "20h00", "21h00", "22h00"],
+    2: ["*Bora* jogar!", "Hoje tem!", "Chegou a hora da xinela."],
+    3: ["http://local.test/abertura/1.png", "http://local.test/abertura/2.png"],
+    6: ["Nao deu hoje.", "Faltou gente."],
+    7: ["http://local.test/naodeu/1.png", "http://local.test/naodeu/2.png"],
+    9: [
+        repr((f"http://local.test/anuncio/{size}.png", [(int(950 * (i + 0.5) / size), 256, 96) for i in range(size)]))
+        for size in range(1, 11)
+    ],
+}
+
+
+def is_local():
+    return env.BACKEND == LOCAL
+
+
+class LocalSheet:
+    """Stand-in for Sheet that serves columns from a JSON file or LOCAL_COLUMNS."""
+
+    def __init__(self, sheet_key, worksheet_index=0):
+        self.sheet_key = sheet_key
+        self.worksheet_index = worksheet_index
+        self.worksheet = None
+
+    def _get_worksheet(self):
+        if self.worksheet is not None:
+            return self.worksheet
+
+        if env.LOCAL_CONTENT_JSON:
+            with open(env.LOCAL_CONTENT_JSON) as file:
+                self.worksheet = {int(column): values for column, values in json.load(file).items()}
+        else:
+            self.worksheet = LOCAL_COLUMNS
+        return self.worksheet
+
+    def refresh_worksheet(self):
+        self.worksheet = None
+        return self._get_worksheet()
+
+    def get_column_values(self, column_index):
+        column_values = self._get_worksheet().get(column_index, [])
+        return [value for value in column_values if value.strip()]
+
+    def eval_get_column_values(self, column_index):
+        column_values = self._get_worksheet().get(column_index, [])
+        return [ast.literal_eval(value) for value in column_values if value.strip()]
+
+
+def get_sheet(sheet_key):
+    if is_local():
+        return LocalSheet(sheet_key)
+
+    from utils.sheet import Sheet
+    return Sheet(sheet_key)
+
+
+def generate_audio(text, voice, model):
+    if is_local():
+        return _silent_wav()
+
+    from elevenlabs import generate, set_api_key
+    set_api_key(env.ELEVENLABS_API)
+    return generate(text=text, voice=voice, model=model)
+
+
+async def fetch_bytes(url):
+    if is_local():
+        return _local_image(url)
+
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            return await response.read()
+
+
+def _silent_wav(seconds=1, rate=8000):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as audio:
+        audio.setnchannels(1)
+        audio.setsampwidth(2)
+        audio.setframerate(rate)
+        audio.writeframes(b"\x00\x00" * rate * seconds)
+    return buffer.getvalue()
+
+
+def _local_image(url):
+    # same url always renders the same image, so runs are reproducible
+    seed = zlib.crc32(url.encode())
+    color = (seed & 0xFF, (seed >> 8) & 0xFF, (seed >> 16) & 0xFF, 255)
+    buffer = io.BytesIO()
+
+    if url.split("?")[0].endswith(".gif"):
+        frames = [Image.new("RGB", (128, 128), color[:3]), Image.new("RGB", (128, 128), color[2::-1])]
+        frames[0].save(buffer, format="GIF", save_all=True, append_images=frames[1:], loop=0)
+    else:
+        Image.new("RGBA", (128, 128), color).save(buffer, format="PNG")
+
+    return buffer.getvalue()
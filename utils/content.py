@@ -1,10 +1,11 @@
 import secrets
-from utils.sheet import Sheet
+import utils.env as env
+from utils.backends import get_sheet
 
 
 class Content:
     def __init__(self):
-        self._sheet = Sheet('1NRhDtTA6CVb6JHFUoSUVtEg3H12o-MUE7c4n3dre9xw')
+        self._sheet = get_sheet(env.SHEET_KEY)
         self._content = {
             "horarios": self._sheet.get_column_values(1),
             "abertura_frases": self._sheet.get_column_values(2),
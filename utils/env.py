@@ -9,3 +9,6 @@ GUILDS_ID_OBJ = disnake.Object(id=os.getenv("GUILD_ID"))
 ROLE_ID = int(os.getenv("ROLE_ID"))
 ELEVENLABS_API = os.getenv("ELEVENLABS_API")
 CREDENTIAL_JSON = os.getenv("CREDENTIAL_JSON")
+BACKEND = os.getenv("BACKEND") or "live"
+SHEET_KEY = os.getenv("SHEET_KEY") or "1NRhDtTA6CVb6JHFUoSUVtEg3H12o-MUE7c4n3dre9xw"
+LOCAL_CONTENT_JSON = os.getenv("LOCAL_CONTENT_JSON")